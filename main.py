@@ -1,25 +1,36 @@
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect, Response, HTTPException, Security, Depends
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect, Request, Response, HTTPException, Security, Depends
 from fastapi.responses import HTMLResponse, FileResponse
 from fastapi.staticfiles import StaticFiles
 from anthropic import Anthropic
 import json
+import orjson
 import asyncio
 from datetime import datetime, timedelta
 from typing import Dict, Any, List, Set
 import logging
 import os
-import base64
+import sys
+import gzip
+import hashlib
+import struct
 from io import BytesIO
 from PIL import Image
 from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from config import (
+    ENVIRONMENT,
     ANTHROPIC_API_KEY, 
     AI_NAME, 
     AI_TAGLINE, 
-    HTML_TEMPLATE, 
-    GALLERY_TEMPLATE,
     SYSTEM_PROMPTS,
-    ARTWORK_TEMPLATE
+    TEMPLATE_DIR,
+    CANVAS,
+    CIRCLE,
+    WAVE,
+    SPIRAL,
+    STROKE_WIDTH_RANGE,
+    ANIMATION_SPEED_RANGE,
+    DRAWING_VALIDATOR
 )
 from pprint import pformat
 import math
@@ -33,8 +44,9 @@ import os
 import time
 from pathlib import Path
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.middleware.gzip import GZipMiddleware
 import aiohttp
 import MySQLdb
 from contextlib import contextmanager
@@ -47,6 +59,8 @@ from functools import lru_cache
 from fastapi_cache import FastAPICache
 from fastapi_cache.backends.inmemory import InMemoryBackend
 from fastapi_cache.decorator import cache
+from pydantic_core import ValidationError
+from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache, select_autoescape
 
 # Setup logging with minimal WebSocket logs
 logging.basicConfig(
@@ -98,9 +112,9 @@ except Exception as e:
 
 # Update the Cloudinary configuration
 cloudinary.config(
-    cloud_name = os.getenv('CLOUDINARY_CLOUD_NAME'),
-    api_key = os.getenv('CLOUDINARY_API_KEY'),
-    api_secret = os.getenv('CLOUDINARY_API_SECRET')
+    cloud_name = ENVIRONMENT.cloudinary_cloud_name,
+    api_key = ENVIRONMENT.cloudinary_api_key,
+    api_secret = ENVIRONMENT.cloudinary_api_secret
 )
 
 # First define the class
@@ -176,6 +190,73 @@ class CircuitBreaker:
                 self.state = "open"
             raise e
 
+# Per-type tables keyed by the interned element type names
+MAX_POINTS_BY_TYPE = {WAVE: 20, SPIRAL: 20, CIRCLE: 32}
+COMPLEXITY_BY_TYPE = {SPIRAL: 3, WAVE: 2, CIRCLE: 1}
+
+def encode_message(data: Dict[str, Any]) -> str:
+    """Serialize a WebSocket message with orjson"""
+    return orjson.dumps(data).decode()
+
+# Broadcast types gallery pages subscribe to; they have no use for the live drawing stream
+GALLERY_EVENT_TYPES = {"gallery_update", "vote_update"}
+
+# fastapi-cache namespace of the gallery listings, cleared whenever a gallery event is broadcast
+GALLERY_CACHE_NAMESPACE = "gallery"
+
+class GalleryEvents:
+    """Fan gallery events out to Server-Sent Events subscribers, one queue per open gallery page"""
+    def __init__(self, keepalive_seconds: float = 15, max_backlog: int = 100):
+        self.keepalive_seconds = keepalive_seconds
+        self.max_backlog = max_backlog
+        self.subscribers: Set[asyncio.Queue] = set()
+
+    def publish(self, data: Dict[str, Any]):
+        """Queue an event for every subscriber; a subscriber too far behind misses it and catches up on reconnect"""
+        message = f"data: {encode_message(data)}\n\n"
+        for queue in self.subscribers:
+            try:
+                queue.put_nowait(message)
+            except asyncio.QueueFull:
+                pass
+
+    async def stream(self):
+        """Yield SSE messages for one subscriber, with comment lines keeping idle connections open"""
+        queue = asyncio.Queue(maxsize=self.max_backlog)
+        self.subscribers.add(queue)
+        try:
+            yield "retry: 5000\n\n"
+            while True:
+                try:
+                    message = await asyncio.wait_for(queue.get(), self.keepalive_seconds)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+                # Everything queued meanwhile goes out in the same write; SSE still splits it into events
+                backlog = [message]
+                while not queue.empty():
+                    backlog.append(queue.get_nowait())
+                yield "".join(backlog)
+        finally:
+            self.subscribers.discard(queue)
+
+gallery_events = GalleryEvents()
+
+# Bytes per packed point: two little-endian float32 values
+POINT_FRAME_SIZE = 8
+
+@dataclass(frozen=True)
+class DrawPoint:
+    """Recorded "draw" canvas command; one is kept per point, so it is slotted rather than a dict"""
+    __slots__ = ("type", "x", "y")
+    type: str
+    x: float
+    y: float
+
+def pack_points(points: List[List[float]]) -> bytes:
+    """Pack [x, y] points into little-endian float32 pairs for a binary WebSocket frame"""
+    return struct.pack(f"<{len(points) * 2}f", *(coord for point in points for coord in point))
+
 class ArtGenerator:
     def __init__(self):
         self.viewers = set()
@@ -326,34 +407,43 @@ IMPORTANT:
                 logger.info(response_text)
 
                 try:
-                    instructions = json.loads(response_text)
-                except json.JSONDecodeError as e:
+                    instructions = orjson.loads(response_text)
+                except orjson.JSONDecodeError as e:
                     logger.error(f"JSON parsing error: {e}")
                     # Attempt to fix common JSON issues
                     response_text = response_text.replace(',,', ',')  # Remove double commas
                     response_text = response_text.replace('][', '],[')  # Fix array separators
-                    instructions = json.loads(response_text)
+                    instructions = orjson.loads(response_text)
 
                 # Validate and clean up instructions
                 if instructions and "elements" in instructions:
                     for element in instructions["elements"]:
+                        # Intern the type so table lookups below hit the identity fast path
+                        if isinstance(element.get("type"), str):
+                            element["type"] = sys.intern(element["type"])
+
                         # Ensure points are within canvas bounds
                         element["points"] = [
-                            [min(max(x, 0), 800), min(max(y, 0), 400)]
+                            [min(max(x, 0), CANVAS.width), min(max(y, 0), CANVAS.height)]
                             for x, y in element["points"]
                         ]
                         
                         # Limit number of points
-                        if element["type"] in ["wave", "spiral"] and len(element["points"]) > 20:
-                            element["points"] = element["points"][:20]
-                        elif element["type"] == "circle" and len(element["points"]) > 32:
-                            element["points"] = element["points"][:32]
+                        max_points = MAX_POINTS_BY_TYPE.get(element["type"])
+                        if max_points and len(element["points"]) > max_points:
+                            element["points"] = element["points"][:max_points]
                         
                         # Ensure required properties
-                        element["animation_speed"] = element.get("animation_speed", 0.02)
-                        element["stroke_width"] = min(max(element.get("stroke_width", 2), 1), 3)
+                        element["animation_speed"] = min(max(element.get("animation_speed", 0.02), ANIMATION_SPEED_RANGE[0]), ANIMATION_SPEED_RANGE[1])
+                        element["stroke_width"] = min(max(element.get("stroke_width", 2), STROKE_WIDTH_RANGE[0]), STROKE_WIDTH_RANGE[1])
                         element["closed"] = element.get("closed", True)
 
+                    try:
+                        DRAWING_VALIDATOR.validate_python(instructions)
+                    except ValidationError as e:
+                        logger.error(f"Instructions failed schema validation: {e}")
+                        return None
+
                     return instructions
                 else:
                     logger.error("Invalid instructions format")
@@ -414,10 +504,25 @@ IMPORTANT:
                 "generation_time": (datetime.now() - self.last_generation_time).seconds
             })
         
+        if data.get("type") in GALLERY_EVENT_TYPES:
+            # Drop cached listings first so the refresh this event triggers sees the change
+            await FastAPICache.clear(namespace=GALLERY_CACHE_NAMESPACE)
+            gallery_events.publish(data)
+
+        # Serialize once for every viewer instead of once per send_json call
+        message = encode_message(data)
+        await self._send_to_viewers(lambda viewer: viewer.send_text(message))
+
+    async def broadcast_frame(self, frame: bytes):
+        """Broadcast a binary frame of packed float32 x,y pairs to all viewers"""
+        await self._send_to_viewers(lambda viewer: viewer.send_bytes(frame))
+
+    async def _send_to_viewers(self, send):
+        """Run send(viewer) for every viewer and drop the ones that fail"""
         disconnected = set()
         for viewer in self.viewers:
             try:
-                await viewer.send_json(data)
+                await send(viewer)
             except Exception as e:
                 logger.error(f"Error broadcasting to viewer: {e}")
                 disconnected.add(viewer)
@@ -425,6 +530,22 @@ IMPORTANT:
         # Remove disconnected viewers
         self.viewers -= disconnected
 
+    def replay_frames(self) -> List[Any]:
+        """Collapse the recorded canvas commands so each element replays as one points frame"""
+        replay = []
+        points = []
+        for cmd in self.current_state:
+            if isinstance(cmd, DrawPoint):
+                points.append((cmd.x, cmd.y))
+                continue
+            if points:
+                replay.append(pack_points(points))
+                points = []
+            replay.append(cmd)
+        if points:
+            replay.append(pack_points(points))
+        return replay
+
     async def update_status(self, status: str, phase: str = None, idea: str = None, progress: float = None):
         """Update and broadcast status"""
         self.current_status = status
@@ -489,6 +610,9 @@ IMPORTANT:
                     distance = math.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2)
                     pixels_in_stroke += distance * stroke_width
                 
+                # Pack the element's points once; each animation step sends an 8-byte slice of it
+                packed = pack_points(points)
+                
                 # Start drawing element
                 logger.info(f"▶️ Starting element {i} with {len(points)} points")
                 start_cmd = {
@@ -504,9 +628,8 @@ IMPORTANT:
                 
                 # Draw points
                 for j, (x, y) in enumerate(points[1:], 1):
-                    draw_cmd = {"type": "draw", "x": x, "y": y}
-                    self.current_state.append(draw_cmd)
-                    await self.broadcast_state(draw_cmd)
+                    self.current_state.append(DrawPoint("draw", x, y))
+                    await self.broadcast_frame(packed[j * POINT_FRAME_SIZE:(j + 1) * POINT_FRAME_SIZE])
                     
                     # Update progress
                     points_drawn += 1
@@ -523,9 +646,8 @@ IMPORTANT:
                 # Close path if needed
                 if element.get("closed", False) and len(points) > 2:
                     logger.info("🔄 Closing path")
-                    close_cmd = {"type": "draw", "x": points[0][0], "y": points[0][1]}
-                    self.current_state.append(close_cmd)
-                    await self.broadcast_state(close_cmd)
+                    self.current_state.append(DrawPoint("draw", points[0][0], points[0][1]))
+                    await self.broadcast_frame(packed[:POINT_FRAME_SIZE])
                     
                     # Add pixels for closing line
                     x1, y1 = points[-1]
@@ -709,8 +831,8 @@ IMPORTANT:
                 await asyncio.sleep(self.retry_delay)
                 continue
 
-    async def save_to_gallery(self, canvas_data: str):
-        """Save drawing to gallery using Cloudinary and PlanetScale"""
+    async def save_to_gallery(self, img_bytes: bytes):
+        """Save the PNG a viewer sent for the finished drawing to Cloudinary and PlanetScale"""
         try:
             async with self.generation_lock:
                 if not self.current_drawing:
@@ -728,11 +850,6 @@ IMPORTANT:
                             logger.warning("Recent save detected, preventing duplicate")
                             return False
 
-                # Process canvas data and upload
-                logger.info("Processing canvas data for upload...")
-                img_data = canvas_data.split(',')[1]
-                img_bytes = base64.b64decode(img_data)
-                
                 # Generate unique ID
                 unique_id = datetime.now().strftime("%Y%m%d_%H%M%S")
                 
@@ -851,12 +968,7 @@ IMPORTANT:
             unique_colors.add(element["color"])
             
             # Add complexity based on element type
-            if element["type"] == "spiral":
-                score += 3
-            elif element["type"] == "wave":
-                score += 2
-            elif element["type"] == "circle":
-                score += 1
+            score += COMPLEXITY_BY_TYPE.get(element["type"], 0)
                 
         # Factor in variety
         score += len(unique_colors) * 0.5
@@ -921,10 +1033,10 @@ class DatabaseService:
             import certifi
             ssl_cert = certifi.where()
             self.config = {
-                "host": os.getenv("DATABASE_HOST"),
-                "user": os.getenv("DATABASE_USERNAME"),
-                "passwd": os.getenv("DATABASE_PASSWORD"),
-                "db": os.getenv("DATABASE"),
+                "host": ENVIRONMENT.database_host,
+                "user": ENVIRONMENT.database_username,
+                "passwd": ENVIRONMENT.database_password,
+                "db": ENVIRONMENT.database,
                 "autocommit": True,
                 "ssl": {
                     "ca": ssl_cert,
@@ -933,10 +1045,10 @@ class DatabaseService:
             }
         else:  # Linux/Unix
             self.config = {
-                "host": os.getenv("DATABASE_HOST"),
-                "user": os.getenv("DATABASE_USERNAME"),
-                "passwd": os.getenv("DATABASE_PASSWORD"),
-                "db": os.getenv("DATABASE"),
+                "host": ENVIRONMENT.database_host,
+                "user": ENVIRONMENT.database_username,
+                "passwd": ENVIRONMENT.database_password,
+                "db": ENVIRONMENT.database,
                 "autocommit": True,
                 "ssl_mode": "VERIFY_IDENTITY",
                 "ssl": {"ca": "/etc/ssl/certs/ca-certificates.crt"}
@@ -1094,9 +1206,22 @@ async def lifespan(app: FastAPI):
         generator.is_running = False
         logger.info("IRIS shutting down")
 
+class VersionedStaticFiles(StaticFiles):
+    """Static files where version-stamped URLs (?v=...) may be cached by browsers indefinitely"""
+    # Saved drawings get a new timestamped name each time and are never rewritten in place
+    immutable_prefixes = ("gallery/",)
+
+    async def get_response(self, path: str, scope) -> Response:
+        response = await super().get_response(path, scope)
+        if response.status_code == 200 and (
+            b"v=" in scope.get("query_string", b"") or path.startswith(self.immutable_prefixes)
+        ):
+            response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        return response
+
 # Finally create the FastAPI app with lifespan
 app = FastAPI(lifespan=lifespan)
-app.mount("/static", StaticFiles(directory="static"), name="static")
+app.mount("/static", VersionedStaticFiles(directory="static"), name="static")
 
 # Add rate limiting middleware
 class RateLimitMiddleware(BaseHTTPMiddleware):
@@ -1127,8 +1252,52 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         response = await call_next(request)
         return response
 
+class DynamicGZipMiddleware(GZipMiddleware):
+    """Gzip JSON API responses, per-request pages and static scripts/styles; static pages are precompressed and images are already compressed"""
+    async def __call__(self, scope, receive, send):
+        path = scope.get("path", "")
+        # The event stream is left alone: gzip would hold each small event back in its buffer
+        if scope["type"] == "http" and path != "/api/gallery/stream" and (
+                path.startswith(("/api/", "/artwork/")) or path.endswith((".css", ".js"))):
+            await super().__call__(scope, receive, send)
+        else:
+            await self.app(scope, receive, send)
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Whether an If-None-Match list names etag, compared weakly (W/ ignored) as RFC 9110 requires"""
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    opaque = etag.removeprefix("W/")
+    return "*" in tags or any(tag.removeprefix("W/") == opaque for tag in tags)
+
+class GalleryETagMiddleware(BaseHTTPMiddleware):
+    """Tag gallery listings with a weak ETag so unchanged polls are answered with 304.
+
+    This is the only validator for /api/gallery: it replaces the ETag and max-age Cache-Control
+    that @cache sets on cache hits. Those headers would let browsers reuse a listing for up to
+    30s after the server cleared its cache, and their hash() tag differs between processes.
+    """
+    async def dispatch(self, request: Request, call_next):
+        if request.method != "GET" or request.url.path != "/api/gallery":
+            return await call_next(request)
+
+        response = await call_next(request)
+        if response.status_code != 200:
+            return response
+
+        body = b"".join([chunk async for chunk in response.body_iterator])
+        etag = f'W/"{hashlib.sha1(body).hexdigest()}"'
+        # no-cache: browsers keep the listing but revalidate it on every poll
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if etag_matches(request.headers.get("if-none-match", ""), etag):
+            return Response(status_code=304, headers=headers)
+        response_headers = dict(response.headers)
+        response_headers.update(headers)
+        return Response(body, headers=response_headers)
+
 # Add middleware to app
 app.add_middleware(RateLimitMiddleware)
+app.add_middleware(GalleryETagMiddleware)
+app.add_middleware(DynamicGZipMiddleware, minimum_size=1000)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -1158,38 +1327,48 @@ async def websocket_endpoint(websocket: WebSocket):
             "viewers": len(generator.viewers),
             "is_running": generator.is_running,
             "total_creations": generator.total_creations,
-            "total_pixels": generator.total_pixels_drawn
+            "total_pixels": generator.total_pixels_drawn,
+            "generation_time": (datetime.now() - generator.last_generation_time).seconds
         }
-        await websocket.send_json(initial_state)
+        await websocket.send_text(encode_message(initial_state))
         
         # If there's a current drawing, send its state
         if generator.current_state:
-            for cmd in generator.current_state:
-                await websocket.send_json(cmd)
+            for frame in generator.replay_frames():
+                if isinstance(frame, bytes):
+                    await websocket.send_bytes(frame)
+                else:
+                    await websocket.send_text(encode_message(frame))
         
         while True:
-            data = await websocket.receive_json()
-            if data.get("type") != "subscribe_status":
-                logger.debug(f"Received WebSocket message: {data}")
-            
-            if data.get("type") == "subscribe_status":
-                await websocket.send_json(initial_state)
-            elif data.get("type") == "canvas_data":
-                # Handle canvas data for gallery save
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(message.get("code", 1000))
+
+            # Binary frames are PNG snapshots of the canvas, sent in reply to request_canvas_data
+            if message.get("bytes") is not None:
                 logger.info("Received canvas data, saving to gallery...")
-                success = await generator.save_to_gallery(data.get("data", ""))
+                success = await generator.save_to_gallery(message["bytes"])
                 if success:
                     logger.info("Successfully saved to gallery")
-                    await websocket.send_json({
+                    await websocket.send_text(encode_message({
                         "type": "save_success",
                         "message": "Artwork saved to gallery"
-                    })
+                    }))
                 else:
                     logger.error("Failed to save to gallery")
-                    await websocket.send_json({
+                    await websocket.send_text(encode_message({
                         "type": "save_error",
                         "message": "Failed to save artwork"
-                    })
+                    }))
+                continue
+
+            data = orjson.loads(message["text"])
+            if data.get("type") != "subscribe_status":
+                logger.debug(f"Received WebSocket message: {data}")
+
+            if data.get("type") == "subscribe_status":
+                await websocket.send_text(encode_message(initial_state))
                 
     except WebSocketDisconnect:
         logger.debug("WebSocket disconnected")
@@ -1214,13 +1393,80 @@ async def websocket_endpoint(websocket: WebSocket):
             except Exception as e:
                 logger.error(f"Error broadcasting viewer count update: {e}")
 
+def minify_html(html: str) -> str:
+    """Drop indentation and blank lines; line breaks are kept so inline scripts parse the same"""
+    return "\n".join(line.strip() for line in html.splitlines() if line.strip())
+
+# Static page shells may be reused briefly, then revalidated in the background so deploys show up on the next visit
+PAGE_CACHE_CONTROL = "public, max-age=600, stale-while-revalidate=86400"
+
+class PrecompressedPage:
+    """HTML page minified, encoded and gzip-compressed once, then served as-is on every request"""
+    def __init__(self, html: str):
+        self.body = minify_html(html).encode("utf-8")
+        self.gzip_body = gzip.compress(self.body, compresslevel=9)
+        # Weak ETag: the identity and gzip bodies are the same page
+        self.etag = f'W/"{hashlib.sha1(self.body).hexdigest()}"'
+
+    def response(self, request: Request) -> Response:
+        """Answer revalidations with 304, otherwise pick the gzip body when the client accepts it"""
+        headers = {"Vary": "Accept-Encoding", "ETag": self.etag, "Cache-Control": PAGE_CACHE_CONTROL}
+        if etag_matches(request.headers.get("if-none-match", ""), self.etag):
+            return Response(status_code=304, headers=headers)
+        if "gzip" in request.headers.get("accept-encoding", ""):
+            headers["Content-Encoding"] = "gzip"
+            return HTMLResponse(self.gzip_body, headers=headers)
+        return HTMLResponse(self.body, headers=headers)
+
+class MinifyingLoader(FileSystemLoader):
+    """Load templates with their markup already minified, so rendered pages skip the whitespace"""
+    def get_source(self, environment, template):
+        source, filename, uptodate = super().get_source(environment, template)
+        return minify_html(source), filename, uptodate
+
+# Jinja environment for pages rendered per request; compiled templates are kept in the bytecode cache
+template_env = Environment(
+    loader=MinifyingLoader(TEMPLATE_DIR),
+    bytecode_cache=FileSystemBytecodeCache(),
+    autoescape=select_autoescape(["html"]),
+    auto_reload=False
+)
+artwork_template = template_env.get_template("artwork.html")
+
+def static_asset_url(name: str) -> str:
+    """URL for a file under static/, stamped with its content hash so it can be cached as immutable"""
+    digest = hashlib.sha1(Path("static", name).read_bytes()).hexdigest()[:12]
+    return f"/static/{name}?v={digest}"
+
+STYLESHEET_URL = static_asset_url("iris.css")
+GALLERY_STYLESHEET_URL = static_asset_url("gallery.css")
+INDEX_STYLESHEET_URL = static_asset_url("index.css")
+ARTWORK_STYLESHEET_URL = static_asset_url("artwork.css")
+GALLERY_SCRIPT_URL = static_asset_url("gallery.js")
+
+home_page = PrecompressedPage(template_env.get_template("index.html").render(
+    stylesheet_url=STYLESHEET_URL,
+    index_stylesheet_url=INDEX_STYLESHEET_URL
+))
+# Items per gallery page; the first page's URL is preloaded from the gallery page's <head>
+GALLERY_PAGE_SIZE = 30
+GALLERY_FIRST_PAGE_URL = f"/api/gallery?sort=new&limit={GALLERY_PAGE_SIZE}&offset=0&columns=true"
+
+gallery_page = PrecompressedPage(template_env.get_template("gallery.html").render(
+    stylesheet_url=STYLESHEET_URL,
+    gallery_stylesheet_url=GALLERY_STYLESHEET_URL,
+    gallery_script_url=GALLERY_SCRIPT_URL,
+    gallery_page_size=GALLERY_PAGE_SIZE,
+    first_page_url=GALLERY_FIRST_PAGE_URL
+))
+
 @app.get("/")
-async def home():
-    return HTMLResponse(HTML_TEMPLATE)
+async def home(request: Request):
+    return home_page.response(request)
 
 @app.get("/gallery")
-async def gallery():
-    return HTMLResponse(GALLERY_TEMPLATE)
+async def gallery(request: Request):
+    return gallery_page.response(request)
 
 @app.get("/api/current-art")
 async def get_current_art():
@@ -1261,9 +1507,9 @@ async def get_status():
 
 # Update the gallery endpoints to use the database service
 @app.get("/api/gallery")
-@cache(expire=5)  # Cache for 5 seconds
-async def get_gallery(sort: str = "new", limit: int = 50, offset: int = 0):
-    """Get gallery items with caching"""
+@cache(expire=30, namespace=GALLERY_CACHE_NAMESPACE)  # Cleared on every gallery/vote update, so it can live longer
+async def get_gallery(sort: str = "new", limit: int = 50, offset: int = 0, columns: bool = False):
+    """Get gallery items with caching; columns=true returns one array per field instead of one object per item"""
     try:
         logger.info(f"Fetching gallery items from PlanetScale (sort: {sort}, limit: {limit}, offset: {offset})")
         with db_service.get_connection() as conn:
@@ -1274,24 +1520,44 @@ async def get_gallery(sort: str = "new", limit: int = 50, offset: int = 0):
                     SELECT * FROM gallery 
                     ORDER BY {order_by}
                     LIMIT %s OFFSET %s
-                """, (limit, offset))
+                """, (limit + 1, offset))
                 items = cursor.fetchall()
                 
+                # The extra row only tells whether there is another page
+                has_more = len(items) > limit
+                items = items[:limit]
+                
                 # Convert datetime objects to strings
                 for item in items:
                     if isinstance(item['timestamp'], datetime):
                         item['timestamp'] = item['timestamp'].isoformat()
 
                 logger.info(f"Retrieved {len(items)} items from PlanetScale")
-                return {
+                page = {
                     "success": True,
-                    "items": items,
-                    "total": len(items)
+                    "total": len(items),
+                    "next_offset": offset + limit if has_more else None
                 }
+                if columns:
+                    # Field names are sent once rather than repeated for every item
+                    names = [column[0] for column in cursor.description]
+                    page["columns"] = {name: [item[name] for item in items] for name in names}
+                else:
+                    page["items"] = items
+                return page
     except Exception as e:
         logger.error(f"Error loading gallery: {e}", exc_info=True)
         return {"success": False, "error": str(e)}
 
+@app.get("/api/gallery/stream")
+async def gallery_stream():
+    """Server-Sent Events stream of new gallery items and vote counts"""
+    return StreamingResponse(
+        gallery_events.stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 @app.get("/static/gallery/{filename}")
 async def get_gallery_image(filename: str):
     """Serve gallery images"""
@@ -1305,7 +1571,7 @@ async def get_gallery_image(filename: str):
         return Response(status_code=500)
 
 API_KEY_NAME = "X-API-Key"
-API_KEY = os.getenv('API_KEY', 'your-default-key')  # Set this in your .env file
+API_KEY = ENVIRONMENT.api_key
 api_key_header = APIKeyHeader(name=API_KEY_NAME, auto_error=True)
 
 async def get_api_key(api_key_header: str = Security(api_key_header)):
@@ -1474,8 +1740,10 @@ async def get_artwork_page(artwork_id: str):
                     else:
                         formatted_timestamp = "Date unknown"
 
-                    # Create a formatted HTML string with the artwork data
-                    artwork_html = ARTWORK_TEMPLATE.format(
+                    # Render the artwork page with the artwork data
+                    artwork_html = artwork_template.render(
+                        stylesheet_url=STYLESHEET_URL,
+                        artwork_stylesheet_url=ARTWORK_STYLESHEET_URL,
                         artwork_url=artwork_url,
                         artwork_description=item.get("description", "No description available"),
                         artwork_reflection=item.get("reflection", "No reflection available"),
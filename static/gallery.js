@@ -0,0 +1,664 @@
+// Gallery page script, loaded deferred so the page markup is already parsed when it runs
+let currentSort = 'new';
+// Vote history is read after first paint; anything that needs it earlier calls loadVotedImages()
+const votedImages = new Set();
+let votedLoaded = false;
+let votedDirty = false;
+let votedFlushHandle = null;
+
+function loadVotedImages() {
+    if (votedLoaded) return;
+    votedLoaded = true;
+    const raw = localStorage.getItem('votedImages');
+    if (raw) {
+        JSON.parse(raw).forEach(id => votedImages.add(id));
+    }
+}
+
+// Re-apply voted state to the items rendered before the history was read
+function refreshVotedButtons() {
+    for (const [index, node] of gallery.nodes) {
+        fillGalleryItem(node, gallery.items[index], index);
+    }
+}
+
+(window.requestIdleCallback || setTimeout)(() => {
+    loadVotedImages();
+    refreshVotedButtons();
+});
+
+function flushVotedImages() {
+    if (votedDirty) {
+        // Merge with the stored history rather than overwrite it
+        loadVotedImages();
+        localStorage.setItem('votedImages', JSON.stringify([...votedImages]));
+        votedDirty = false;
+    }
+    votedFlushHandle = null;
+}
+
+// Coalesce votes into a single localStorage write once the browser is idle
+function scheduleVotedFlush() {
+    votedDirty = true;
+    if (votedFlushHandle !== null) return;
+    votedFlushHandle = window.requestIdleCallback
+        ? requestIdleCallback(flushVotedImages, { timeout: 500 })
+        : setTimeout(flushVotedImages, 500);
+}
+
+// Persist anything still pending before the page goes away
+window.addEventListener('pagehide', flushVotedImages);
+
+function showToast(message, duration = 3000) {
+    const toast = document.getElementById('toast');
+    toast.textContent = message;
+    toast.classList.add('show');
+    setTimeout(() => toast.classList.remove('show'), duration);
+}
+
+// Add showReflection function
+// Cloned from its template on first use, then hidden and shown again rather than rebuilt
+let reflectionModal = null;
+
+function hideReflection() {
+    if (reflectionModal) reflectionModal.style.display = 'none';
+}
+
+function showReflection(id, reflection) {
+    let modal = reflectionModal;
+    if (!modal) {
+        modal = reflectionModal = document.getElementById('reflection-modal-template').content.firstElementChild.cloneNode(true);
+        const closeBtn = modal.querySelector('.reflection-close');
+        document.body.appendChild(modal);
+
+        // Installed once with the modal: the close button or a click outside the content hides it, as does Escape
+        modal.addEventListener('click', (e) => {
+            if (e.target === modal || e.target === closeBtn) hideReflection();
+        });
+        document.addEventListener('keydown', (e) => {
+            if (e.key === 'Escape') hideReflection();
+        });
+    }
+
+    // Update reflection text
+    modal.querySelector('.reflection-text').textContent = reflection;
+    modal.style.display = 'flex';
+}
+
+// Windowed gallery: only rows near the viewport have DOM nodes, recycled as the user scrolls
+const OVERSCAN_ROWS = 1;
+const PAGE_SIZE = +document.getElementById('gallery-container').dataset.pageSize;
+const gallery = {
+    items: [],
+    nextOffset: null,   // offset of the next page, null once the last page is loaded
+    loadingPage: false,
+    loading: null,      // token of the first-page load in flight; refreshes wait for it instead of starting another
+    generation: 0,      // bumped on reset so late pages from a previous load are dropped
+    abort: new AbortController(),   // cancels the current load's requests on reset
+    nodes: new Map(),   // item index -> rendered node
+    spare: [],          // detached nodes kept for reuse
+    cols: 1,
+    rowHeight: 0,       // item height plus row gap, measured once rows are rendered
+    frame: null
+};
+
+const itemTemplate = document.getElementById('gallery-item-template');
+
+function createGalleryItem() {
+    const node = itemTemplate.content.firstElementChild.cloneNode(true);
+    node.parts = {
+        links: node.querySelectorAll('a'),
+        image: node.querySelector('img'),
+        description: node.querySelector('.description'),
+        timestamp: node.querySelector('.timestamp'),
+        votes: node.querySelector('.vote-count span'),
+        voteButton: node.querySelector('.vote-button')
+    };
+    return node;
+}
+
+// One listener on the grid serves every item; it resolves the item the node currently shows
+const galleryContainer = document.getElementById('gallery-container');
+galleryContainer.addEventListener('click', (event) => {
+    const button = event.target.closest('.gallery-item button');
+    if (!button) return;
+    const item = gallery.items[button.closest('.gallery-item').dataset.index];
+    if (button.classList.contains('vote-button')) {
+        handleVote(button);
+    } else if (button.classList.contains('reflection-button')) {
+        showReflection(item.id, item.reflection || 'No reflection available');
+    } else if (button.classList.contains('share-button')) {
+        shareArtwork(item.id, item.description || 'Geometric pattern');
+    }
+});
+// Image errors don't bubble, so catch them on the way down
+galleryContainer.addEventListener('error', (event) => {
+    if (event.target.tagName === 'IMG') {
+        console.error('Failed to load image:', event.target.src);
+    }
+}, true);
+
+// Cloudinary resizes and picks AVIF/WebP (f_auto) on the fly from the delivery URL
+const IMAGE_WIDTHS = [350, 700, 1400];
+
+function imageVariant(url, width) {
+    return url.replace('/image/upload/', `/image/upload/w_${width},c_limit,f_auto,q_auto/`);
+}
+
+// src and srcset (null when the host can't resize) for an item's image
+function imageSources(item) {
+    if (item.url && item.url.includes('/image/upload/')) {
+        return {
+            src: imageVariant(item.url, 700),
+            srcset: IMAGE_WIDTHS.map(width => `${imageVariant(item.url, width)} ${width}w`).join(', ')
+        };
+    }
+    return { src: item.url || `/static/gallery/${item.filename}`, srcset: null };
+}
+
+// Warm the HTTP cache with the images just below the rendered window while the page is idle
+const PREFETCH_AHEAD = 10;
+const prefetchedImages = new Set();
+let prefetchFrom = 0;
+let prefetchPending = false;
+
+function prefetchImages() {
+    prefetchPending = false;
+    const sizes = itemTemplate.content.querySelector('img').sizes;
+    for (const item of gallery.items.slice(prefetchFrom, prefetchFrom + PREFETCH_AHEAD)) {
+        const id = String(item.id);
+        if (prefetchedImages.has(id)) continue;
+        prefetchedImages.add(id);
+        // Same srcset/sizes as the rendered <img>, so the browser picks the same candidate
+        const { src, srcset } = imageSources(item);
+        const image = new Image();
+        image.fetchPriority = 'low';
+        image.sizes = sizes;
+        if (srcset) image.srcset = srcset;
+        image.src = src;
+    }
+}
+
+function schedulePrefetch(from) {
+    prefetchFrom = from;
+    if (prefetchPending) return;
+    prefetchPending = true;
+    (window.requestIdleCallback || setTimeout)(prefetchImages);
+}
+
+// One formatter for every timestamp; toLocaleString would build a new one per call
+const TIMESTAMP_FORMAT = new Intl.DateTimeFormat(undefined, { dateStyle: 'short', timeStyle: 'short' });
+
+function fillGalleryItem(node, item, index) {
+    const { links, image, description, timestamp, votes, voteButton } = node.parts;
+    const text = item.description || 'Geometric pattern';
+    const voted = votedImages.has(String(item.id));
+
+    node.dataset.index = index;
+    node.dataset.id = item.id;
+    links.forEach(link => link.href = `/artwork/${item.id}`);
+    // Only the first rows are above the fold on load
+    image.fetchPriority = index < 6 ? 'high' : 'low';
+    const { src, srcset } = imageSources(item);
+    if (srcset) {
+        image.srcset = srcset;
+    } else {
+        image.removeAttribute('srcset');
+    }
+    image.src = src;
+    image.alt = text;
+    description.textContent = text;
+    // Formatted once per item and kept on it for later refills
+    item.displayTime ??= TIMESTAMP_FORMAT.format(new Date(item.timestamp));
+    timestamp.textContent = item.displayTime;
+    votes.textContent = item.votes || 0;
+    voteButton.dataset.id = item.id;
+    voteButton.classList.toggle('voted', voted);
+    voteButton.disabled = voted;
+    voteButton.textContent = voted ? '✓ Voted' : '↑ Upvote';
+}
+
+function measureRows(container) {
+    const styles = getComputedStyle(container);
+    gallery.cols = Math.max(1, styles.gridTemplateColumns.split(' ').length);
+    let itemHeight = 0;
+    for (const node of gallery.nodes.values()) {
+        itemHeight = Math.max(itemHeight, node.offsetHeight);
+    }
+    // Pin every row to the tallest item so row offsets are exact multiples
+    container.style.gridAutoRows = `${itemHeight}px`;
+    gallery.rowHeight = itemHeight + parseFloat(styles.rowGap);
+}
+
+function renderWindow() {
+    gallery.frame = null;
+    const container = document.getElementById('gallery-container');
+    const { items, nodes, cols } = gallery;
+    if (!items.length) return;
+
+    // Until the first rows are measured, assume roughly one image height per row
+    const rowHeight = gallery.rowHeight || 300;
+    const rowCount = Math.ceil(items.length / cols);
+    const scrolled = Math.max(0, -container.getBoundingClientRect().top);
+    const firstRow = Math.max(0, Math.floor(scrolled / rowHeight) - OVERSCAN_ROWS);
+    const lastRow = Math.min(rowCount, Math.ceil((scrolled + window.innerHeight) / rowHeight) + OVERSCAN_ROWS);
+    const start = firstRow * cols;
+    const end = Math.min(items.length, lastRow * cols);
+
+    for (const [index, node] of nodes) {
+        if (index < start || index >= end) {
+            node.remove();
+            nodes.delete(index);
+            gallery.spare.push(node);
+        }
+    }
+
+    // Kept nodes are a contiguous run, so new ones only go before or after it;
+    // each side is attached with a single fragment insert
+    const before = document.createDocumentFragment();
+    const after = document.createDocumentFragment();
+    let firstKept = null;
+    for (let i = start; i < end; i++) {
+        let node = nodes.get(i);
+        if (node) {
+            firstKept ??= node;
+            continue;
+        }
+        node = gallery.spare.pop() || createGalleryItem();
+        fillGalleryItem(node, items[i], i);
+        nodes.set(i, node);
+        (firstKept ? after : before).appendChild(node);
+    }
+    container.insertBefore(before, firstKept);
+    container.append(after);
+
+    container.style.setProperty('--window-top', `${firstRow * rowHeight}px`);
+    container.style.setProperty('--window-bottom', `${(rowCount - lastRow) * rowHeight}px`);
+
+    if (!gallery.rowHeight) {
+        measureRows(container);
+        renderWindow();
+        return;
+    }
+    schedulePrefetch(end);
+}
+
+function scheduleRender() {
+    if (gallery.frame === null) {
+        gallery.frame = requestAnimationFrame(renderWindow);
+    }
+}
+
+// Drop every rendered item and show a status message in the grid instead
+function resetGallery(container, tag, className, text) {
+    for (const node of gallery.nodes.values()) {
+        gallery.spare.push(node);
+    }
+    gallery.nodes.clear();
+    gallery.items = [];
+    gallery.nextOffset = null;
+    gallery.generation++;
+    gallery.abort.abort();
+    gallery.abort = new AbortController();
+    container.style.removeProperty('--window-top');
+    container.style.removeProperty('--window-bottom');
+    const message = document.createElement(tag);
+    message.className = className;
+    message.textContent = text;
+    container.replaceChildren(message);
+}
+
+window.addEventListener('scroll', scheduleRender, { passive: true });
+window.addEventListener('resize', () => {
+    gallery.rowHeight = 0;
+    document.getElementById('gallery-container').style.gridAutoRows = '';
+    scheduleRender();
+});
+
+// Rebuild item objects from the columnar payload; every item gets the same field order
+function itemsFromColumns(columns) {
+    const names = Object.keys(columns);
+    const count = names.length ? columns[names[0]].length : 0;
+    const items = new Array(count);
+    for (let i = 0; i < count; i++) {
+        const item = {};
+        for (const name of names) {
+            item[name] = columns[name][i];
+        }
+        items[i] = item;
+    }
+    return items;
+}
+
+async function fetchGalleryPage(sort, offset) {
+    const response = await fetch(`/api/gallery?sort=${sort}&limit=${PAGE_SIZE}&offset=${offset}&columns=true`, {
+        signal: gallery.abort.signal
+    });
+    const data = await response.json();
+    if (data.columns) {
+        data.items = itemsFromColumns(data.columns);
+    }
+    return data;
+}
+
+function appendGalleryItems(items) {
+    for (const item of items) {
+        if (!item.url && !item.filename) {
+            console.error('Missing URL for item:', item);
+            continue;
+        }
+        gallery.items.push(item);
+    }
+}
+
+// Fetch the next page once the sentinel below the grid nears the viewport
+const pageObserver = new IntersectionObserver(entries => {
+    if (entries[0].isIntersecting) loadNextPage();
+}, { rootMargin: '600px 0px' });
+
+function watchForNextPage() {
+    // Re-observing reports the current intersection again, covering pages too short to scroll
+    const sentinel = document.getElementById('gallery-sentinel');
+    pageObserver.unobserve(sentinel);
+    if (gallery.nextOffset !== null) {
+        pageObserver.observe(sentinel);
+    }
+}
+
+async function loadNextPage() {
+    if (gallery.nextOffset === null || gallery.loadingPage) return;
+    const generation = gallery.generation;
+    gallery.loadingPage = true;
+    try {
+        const data = await fetchGalleryPage(currentSort, gallery.nextOffset);
+        if (generation !== gallery.generation || !data.success) return;
+        appendGalleryItems(data.items);
+        gallery.nextOffset = data.next_offset ?? null;
+        renderWindow();
+    } catch (error) {
+        if (error.name === 'AbortError') return;
+        console.error('Error loading more artworks:', error);
+    } finally {
+        gallery.loadingPage = false;
+        if (generation === gallery.generation) watchForNextPage();
+    }
+}
+
+async function loadGallery(sort = 'new') {
+    const container = document.getElementById('gallery-container');
+    console.log('Loading gallery...');
+    resetGallery(container, 'div', 'gallery-loading', 'Loading gallery...');
+
+    const generation = gallery.generation;
+    const load = gallery.loading = {};
+    try {
+        const data = await fetchGalleryPage(sort, 0);
+        console.log('Gallery data:', data);
+        if (generation !== gallery.generation) return;
+
+        if (!data.success || !data.items || !data.items.length) {
+            resetGallery(container, 'p', 'gallery-empty', 'No artworks yet. Check back soon!');
+            return;
+        }
+
+        appendGalleryItems(data.items);
+        gallery.nextOffset = data.next_offset ?? null;
+        container.replaceChildren();
+        renderWindow();
+        watchForNextPage();
+
+        console.log('Gallery rendered successfully');
+
+    } catch (error) {
+        // Superseded by a newer load, which owns the grid now
+        if (error.name === 'AbortError') return;
+        console.error('Error loading gallery:', error);
+        resetGallery(container, 'p', 'gallery-error', 'Error loading gallery. Please try again later.');
+    } finally {
+        // A newer load owns the flag once it has started
+        if (gallery.loading === load) gallery.loading = null;
+    }
+}
+
+// Image ids with a vote request in flight or sent within the last second
+const votesInFlight = new Set();
+
+// Refill the node showing an item, if it is currently rendered
+function refreshGalleryItem(index) {
+    const node = gallery.nodes.get(index);
+    if (node) {
+        fillGalleryItem(node, gallery.items[index], index);
+    }
+}
+
+// Re-order the loaded items by votes and re-render, without refetching
+function sortLoadedByVotes() {
+    gallery.items.sort((a, b) => (b.votes || 0) - (a.votes || 0));
+    for (const node of gallery.nodes.values()) {
+        node.remove();
+        gallery.spare.push(node);
+    }
+    gallery.nodes.clear();
+    renderWindow();
+}
+
+function prependGalleryItems(items) {
+    gallery.items.unshift(...items);
+    if (gallery.nextOffset !== null) {
+        gallery.nextOffset += items.length;
+    }
+    // Rendered nodes keep their items; only their indices move
+    const shifted = new Map();
+    for (const [index, node] of gallery.nodes) {
+        node.dataset.index = index + items.length;
+        shifted.set(index + items.length, node);
+    }
+    gallery.nodes = shifted;
+    renderWindow();
+}
+
+// Merge the first page into the loaded items instead of rebuilding the grid:
+// changed vote counts are patched in place and new artworks are added
+async function refreshGallery() {
+    if (!galleryStarted || gallery.loading) return;
+    if (!gallery.items.length) {
+        return loadGallery(currentSort);
+    }
+    const generation = gallery.generation;
+    try {
+        const data = await fetchGalleryPage(currentSort, 0);
+        if (generation !== gallery.generation || !data.success) return;
+
+        const indexById = new Map(gallery.items.map((item, index) => [String(item.id), index]));
+        const added = [];
+        let votesChanged = false;
+        for (const item of data.items) {
+            const id = String(item.id);
+            const index = indexById.get(id);
+            if (index === undefined) {
+                if (item.url || item.filename) added.push(item);
+            } else if (gallery.items[index].votes !== item.votes && !votesInFlight.has(id)) {
+                gallery.items[index].votes = item.votes;
+                refreshGalleryItem(index);
+                votesChanged = true;
+            }
+        }
+
+        if (currentSort === 'votes') {
+            if (added.length || votesChanged) {
+                gallery.items.push(...added);
+                sortLoadedByVotes();
+            }
+        } else if (added.length) {
+            prependGalleryItems(added);
+        }
+    } catch (error) {
+        if (error.name === 'AbortError') return;
+        console.error('Error refreshing gallery:', error);
+    }
+}
+
+async function handleVote(button) {
+    const imageId = button.dataset.id;
+    loadVotedImages();
+    if (votedImages.has(imageId) || votesInFlight.has(imageId)) return;
+    votesInFlight.add(imageId);
+
+    const index = +button.closest('.gallery-item').dataset.index;
+    const item = gallery.items[index];
+    const previous = item.votes || 0;
+
+    // Count the vote straight away; rolled back below if the server rejects it
+    votedImages.add(imageId);
+    item.votes = previous + 1;
+    refreshGalleryItem(index);
+
+    try {
+        const response = await fetch(`/api/gallery/${imageId}/upvote`, {
+            method: 'POST'
+        });
+
+        if (!response.ok) throw new Error('Failed to upvote');
+
+        const data = await response.json();
+        item.votes = data.votes;
+        if (gallery.items[index] === item) refreshGalleryItem(index);
+
+        // Save voted state
+        scheduleVotedFlush();
+
+        showToast('Vote recorded! Thank you for participating.');
+
+        if (currentSort === 'votes') {
+            sortLoadedByVotes();
+        }
+    } catch (error) {
+        console.error('Error voting:', error);
+        votedImages.delete(imageId);
+        item.votes = previous;
+        if (gallery.items[index] === item) refreshGalleryItem(index);
+        showToast('Failed to register vote. Please try again.', 5000);
+    } finally {
+        setTimeout(() => votesInFlight.delete(imageId), 1000);
+    }
+}
+
+async function shareArtwork(id, description) {
+    try {
+        const shareText = `Check out this AI-generated artwork by @IRISAISOLANA:\n\n${description}\n\n${window.location.origin}/gallery`;
+
+        if (navigator.share) {
+            await navigator.share({
+                text: shareText,
+                url: `${window.location.origin}/gallery`
+            });
+        } else {
+            await navigator.clipboard.writeText(shareText);
+            showToast('Share text copied to clipboard!');
+        }
+    } catch (error) {
+        console.error('Error sharing:', error);
+        showToast('Failed to share. Please try again.');
+    }
+}
+
+// Add sort button handlers
+document.querySelectorAll('.sort-button').forEach(button => {
+    button.addEventListener('click', async () => {
+        const sort = button.dataset.sort;
+        if (sort === currentSort) return;
+
+        document.querySelector('.sort-button.active').classList.remove('active');
+        button.classList.add('active');
+
+        currentSort = sort;
+        await loadGallery(sort);
+    });
+});
+
+// Initial load, deferred until the grid is close to the viewport
+let galleryStarted = false;
+
+function startGallery() {
+    if (galleryStarted) return;
+    galleryStarted = true;
+    console.log('Initializing gallery...');
+    loadGallery(currentSort);
+}
+
+document.addEventListener('DOMContentLoaded', () => {
+    const container = document.getElementById('gallery-container');
+    // Fast path: the grid is already within two screens of the top
+    if (container.getBoundingClientRect().top < window.innerHeight * 2) {
+        startGallery();
+        return;
+    }
+    const observer = new IntersectionObserver((entries) => {
+        if (entries[0].isIntersecting) {
+            observer.disconnect();
+            startGallery();
+        }
+    }, { rootMargin: '200px' });
+    observer.observe(container);
+});
+
+// Apply a vote count pushed by the server to the loaded item, if any
+function updateVoteCount(imageId, votes) {
+    const index = gallery.items.findIndex(item => String(item.id) === String(imageId));
+    if (index === -1) return;
+    gallery.items[index].votes = votes;
+    refreshGalleryItem(index);
+}
+
+// New items and vote counts are pushed over Server-Sent Events; EventSource reconnects by itself
+function connectGalleryEvents() {
+    const events = new EventSource('/api/gallery/stream');
+
+    // The first open races the initial load, which already fetches the latest page
+    let hasOpened = false;
+    events.onopen = () => {
+        // Catch up on anything missed while disconnected
+        if (hasOpened) refreshGallery();
+        hasOpened = true;
+    };
+
+    // Events pushed while the tab is hidden wait for its first frame back, since animation frames
+    // don't run in the background. A full refresh on return is only needed if the stream was down.
+    document.addEventListener('visibilitychange', () => {
+        if (document.visibilityState === 'visible' && events.readyState !== EventSource.OPEN) {
+            refreshGallery();
+        }
+    });
+
+    events.onmessage = (event) => {
+        const data = JSON.parse(event.data);
+        if (data.type === 'gallery_update') {
+            pendingEvents.refresh = true;
+        } else if (data.type === 'vote_update') {
+            pendingEvents.votes.set(data.image_id, data.votes);
+        } else {
+            return;
+        }
+        if (pendingEvents.frame === null) {
+            pendingEvents.frame = requestAnimationFrame(flushGalleryEvents);
+        }
+    };
+}
+
+// Events arriving within one frame are applied together: one refetch, and one write per voted item
+const pendingEvents = { votes: new Map(), refresh: false, frame: null };
+
+function flushGalleryEvents() {
+    const { votes, refresh } = pendingEvents;
+    pendingEvents.votes = new Map();
+    pendingEvents.refresh = false;
+    pendingEvents.frame = null;
+    for (const [imageId, count] of votes) {
+        updateVoteCount(imageId, count);
+    }
+    if (refresh) {
+        refreshGallery();
+    }
+}
+
+connectGalleryEvents();